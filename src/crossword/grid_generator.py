@@ -6,17 +6,37 @@ from a list of words. It uses a backtracking algorithm to place words
 while maintaining crossword validity constraints.
 """
 
-from dataclasses import dataclass, field
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from operator import eq
+from typing import Iterable, Iterator, Optional
 import random
 
 
+# Cell values in the flat grid buffer; letters are stored as their ASCII code.
+EMPTY = 0
+BLOCK = 1
+_NON_LETTERS = bytes((EMPTY, BLOCK))
+# translate() table that renders EMPTY/BLOCK as '.' and leaves letters as-is
+_JSON_CELLS = bytes(range(256)).translate(bytes.maketrans(_NON_LETTERS, b'..'))
+
+# to_ascii cell pieces
+_BLOCK_CELL = '███'
+_NO_NUMBER = '  '
+
+
 class Direction(Enum):
     ACROSS = "across"
     DOWN = "down"
 
 
+# Direction codes stored in CrosswordGrid._pw_dirs
+_DIRECTIONS = (Direction.ACROSS, Direction.DOWN)
+_DIR_CODES = {Direction.ACROSS: 0, Direction.DOWN: 1}
+
+
 @dataclass
 class PlacedWord:
     """Represents a word placed in the grid."""
@@ -27,8 +47,79 @@ class PlacedWord:
     number: int = 0
     clue: str = ""
 
+    def __setattr__(self, name, value):
+        # Views handed out by CrosswordGrid.placed_words write clues back to
+        # the grid; the layout fields are owned by the grid and read-only
+        owner = self.__dict__.get('_owner')
+        if owner is not None:
+            if name != 'clue':
+                raise AttributeError(f"PlacedWord.{name} is read-only on a placed word")
+            clues, k = owner
+            clues[k] = value
+        object.__setattr__(self, name, value)
+
+
+def _encode_word(word) -> bytes:
+    """Return *word* as uppercase ASCII bytes; bytes are assumed pre-encoded."""
+    if isinstance(word, str):
+        return word.upper().encode('ascii')
+    return word
+
+
+def _can_place_across(g: bytearray, rows: int, cols: int, word_bytes: bytes,
+                      row: int, col: int) -> bool:
+    """Placement check kernel for an ACROSS word over the flat grid buffer.
+
+    Works on plain ints and byte buffers only, so there are no attribute or
+    enum lookups. The cells under the word are checked as a single slice:
+    every cell must be EMPTY or hold the matching letter, so the EMPTY count
+    plus the number of matching letters must equal the word length (BLOCK
+    counts as neither). *rows* is unused here but keeps both kernels
+    interchangeable in _PLACE_CHECKS.
+    """
+    length = len(word_bytes)
+    base = row * cols + col
+    end = col + length
+    stop = base + length
+    # Check bounds
+    if end > cols:
+        return False
+    # Check for letter before word start
+    if col > 0 and g[base - 1] > BLOCK:
+        return False
+    # Check for letter after word end
+    if end < cols and g[stop] > BLOCK:
+        return False
+
+    cells = g[base:stop]
+    return cells.count(EMPTY) + sum(map(eq, cells, word_bytes)) == length
+
+
+def _can_place_down(g: bytearray, rows: int, cols: int, word_bytes: bytes,
+                    row: int, col: int) -> bool:
+    """Placement check kernel for a DOWN word; see _can_place_across."""
+    length = len(word_bytes)
+    base = row * cols + col
+    end = row + length
+    stop = base + length * cols
+    # Check bounds
+    if end > rows:
+        return False
+    # Check for letter before word start
+    if row > 0 and g[base - cols] > BLOCK:
+        return False
+    # Check for letter after word end
+    if end < rows and g[stop] > BLOCK:
+        return False
+
+    cells = g[base:stop:cols]
+    return cells.count(EMPTY) + sum(map(eq, cells, word_bytes)) == length
+
+
+# Placement kernels indexed by direction code
+_PLACE_CHECKS = (_can_place_across, _can_place_down)
+
 
-@dataclass
 class CrosswordGrid:
     """
     Represents a crossword puzzle grid.
@@ -36,159 +127,219 @@ class CrosswordGrid:
     Attributes:
         rows: Number of rows in the grid
         cols: Number of columns in the grid
-        grid: 2D list of characters (None for empty, '.' for blocked)
-        placed_words: List of words placed in the grid
+        grid: Flat row-major buffer of cells (EMPTY, BLOCK, or an ASCII
+            letter code); cell (r, c) lives at index r * cols + c
+        placed_words: Tuple of the words placed in the grid
+
+    Placed words are stored column-wise in parallel arrays (``_pw_words``,
+    ``_pw_rows``, ``_pw_cols``, ``_pw_dirs``, ``_pw_numbers``, ``_pw_clues``)
+    so the placement search only touches the compact row/col/direction data.
+    ``_letter_index`` maps each letter code to the (word index, offset) pairs
+    where it occurs, so intersections are found without scanning every word.
+    Words passed as *placed_words* are placed in order with place_word.
     """
     rows: int
     cols: int
-    grid: list = field(default_factory=list)
-    placed_words: list = field(default_factory=list)
-
-    def __post_init__(self):
-        if not self.grid:
-            self.grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
-
-    def can_place_word(self, word: str, row: int, col: int, direction: Direction) -> bool:
-        """Check if a word can be placed at the given position."""
-        word = word.upper()
+    grid: bytearray
+
+    def __init__(self, rows: int, cols: int, grid: Optional[bytearray] = None,
+                 placed_words: Iterable[PlacedWord] = ()):
+        self.rows = rows
+        self.cols = cols
+        self.grid = grid if grid else bytearray(rows * cols)
+        self._stride = cols
+        self._pw_words: list[str] = []
+        self._pw_rows = array('i')
+        self._pw_cols = array('i')
+        self._pw_dirs = bytearray()
+        self._pw_numbers = array('i')
+        self._pw_clues: list[str] = []
+        self._letter_index: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        # Clue numbers only change when a word is placed
+        self._numbers_dirty = True
+        self._number_map: dict[tuple[int, int], int] = {}
+        self._clue_order: tuple[list[int], list[int]] = ([], [])
+        for pw in placed_words:
+            self.place_word(pw.word, pw.row, pw.col, pw.direction, pw.clue)
+
+    def __repr__(self) -> str:
+        return (f"CrosswordGrid(rows={self.rows!r}, cols={self.cols!r}, "
+                f"grid={self.grid!r}, placed_words={list(self.placed_words)!r})")
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Clue numbers are derived from the positions, so they are not compared
+        return (self.rows == other.rows and self.cols == other.cols
+                and self.grid == other.grid
+                and self._pw_words == other._pw_words
+                and self._pw_rows == other._pw_rows
+                and self._pw_cols == other._pw_cols
+                and self._pw_dirs == other._pw_dirs
+                and self._pw_clues == other._pw_clues)
+
+    def _placed_word(self, k: int) -> PlacedWord:
+        """Build a PlacedWord view of the k-th placed word.
+
+        Setting ``clue`` on the view updates the grid; the other fields are
+        read-only.
+        """
+        pw = PlacedWord(
+            word=self._pw_words[k],
+            row=self._pw_rows[k],
+            col=self._pw_cols[k],
+            direction=_DIRECTIONS[self._pw_dirs[k]],
+            number=self._pw_numbers[k],
+            clue=self._pw_clues[k],
+        )
+        object.__setattr__(pw, '_owner', (self._pw_clues, k))
+        return pw
+
+    @property
+    def placed_words(self) -> tuple:
+        """Words placed in the grid, as PlacedWord views in placement order.
+
+        Use place_word to add words; the tuple itself cannot be changed.
+        """
+        return tuple(self._placed_word(k) for k in range(len(self._pw_words)))
+
+    @property
+    def number_map(self) -> dict:
+        """Clue number for each (row, col) start square.
+
+        Built alongside the clue numbers and shared between callers, so treat
+        it as read-only.
+        """
+        self.assign_numbers()
+        return self._number_map
 
+    def clues_by_direction(self) -> tuple[list, list]:
+        """Return (across, down) PlacedWord views, each sorted by clue number."""
+        self.assign_numbers()
+        across, down = self._clue_order
+        return [self._placed_word(k) for k in across], [self._placed_word(k) for k in down]
+
+    def can_place_word(self, word_bytes: bytes, row: int, col: int, direction: Direction) -> bool:
+        """Check if a word (uppercase ASCII bytes) can be placed at the given position."""
+        check = _PLACE_CHECKS[_DIR_CODES[direction]]
+        return check(self.grid, self.rows, self.cols, _encode_word(word_bytes), row, col)
+
+    def place_word(self, word_bytes: bytes, row: int, col: int, direction: Direction,
+                   clue: str = "") -> PlacedWord:
+        """Place a word (uppercase ASCII bytes) in the grid.
+
+        Raises:
+            ValueError: If the word would not fit inside the grid
+        """
+        word_bytes = _encode_word(word_bytes)
+        # Slice writes on the flat buffer would wrap rows or grow it instead
+        # of failing, so bounds are checked explicitly
         if direction == Direction.ACROSS:
-            # Check bounds
-            if col + len(word) > self.cols:
-                return False
-            # Check for letter before word start
-            if col > 0 and self.grid[row][col - 1] not in (None, '.'):
-                return False
-            # Check for letter after word end
-            if col + len(word) < self.cols and self.grid[row][col + len(word)] not in (None, '.'):
-                return False
-
-            for i, letter in enumerate(word):
-                current = self.grid[row][col + i]
-                if current == '.':
-                    return False
-                if current is not None and current != letter:
-                    return False
-                # If empty, check adjacent cells (above and below)
-                if current is None:
-                    # Check above
-                    if row > 0 and self.grid[row - 1][col + i] not in (None, '.'):
-                        # Only allow if this is an intersection
-                        pass
-                    # Check below
-                    if row < self.rows - 1 and self.grid[row + 1][col + i] not in (None, '.'):
-                        pass
-        else:  # DOWN
-            if row + len(word) > self.rows:
-                return False
-            # Check for letter before word start
-            if row > 0 and self.grid[row - 1][col] not in (None, '.'):
-                return False
-            # Check for letter after word end
-            if row + len(word) < self.rows and self.grid[row + len(word)][col] not in (None, '.'):
-                return False
-
-            for i, letter in enumerate(word):
-                current = self.grid[row + i][col]
-                if current == '.':
-                    return False
-                if current is not None and current != letter:
-                    return False
-
-        return True
-
-    def place_word(self, word: str, row: int, col: int, direction: Direction, clue: str = "") -> PlacedWord:
-        """Place a word in the grid."""
-        word = word.upper()
+            fits = row < self.rows and col + len(word_bytes) <= self.cols
+        else:
+            fits = col < self.cols and row + len(word_bytes) <= self.rows
+        if row < 0 or col < 0 or not fits:
+            raise ValueError(f"{word_bytes.decode('ascii')!r} does not fit in the grid "
+                             f"at ({row}, {col}) {direction.value}")
+        base = row * self._stride + col
 
         if direction == Direction.ACROSS:
-            for i, letter in enumerate(word):
-                self.grid[row][col + i] = letter
+            self.grid[base:base + len(word_bytes)] = word_bytes
         else:
-            for i, letter in enumerate(word):
-                self.grid[row + i][col] = letter
-
-        placed = PlacedWord(word=word, row=row, col=col, direction=direction, clue=clue)
-        self.placed_words.append(placed)
-        return placed
-
-    def find_intersections(self, word: str) -> list:
-        """Find all possible positions where word can intersect with existing words."""
-        word = word.upper()
-        positions = []
-
-        for placed in self.placed_words:
-            for i, letter in enumerate(word):
-                for j, placed_letter in enumerate(placed.word):
-                    if letter == placed_letter:
-                        # Calculate intersection position
-                        if placed.direction == Direction.ACROSS:
-                            # New word goes DOWN
-                            new_row = placed.row - i
-                            new_col = placed.col + j
-                            new_dir = Direction.DOWN
-                        else:
-                            # New word goes ACROSS
-                            new_row = placed.row + j
-                            new_col = placed.col - i
-                            new_dir = Direction.ACROSS
-
-                        if new_row >= 0 and new_col >= 0:
-                            if self.can_place_word(word, new_row, new_col, new_dir):
-                                positions.append((new_row, new_col, new_dir))
-
-        return positions
+            step = self._stride
+            self.grid[base:base + len(word_bytes) * step:step] = word_bytes
+
+        k = len(self._pw_words)
+        for i, letter in enumerate(word_bytes):
+            self._letter_index[letter].append((k, i))
+
+        self._pw_words.append(word_bytes.decode('ascii'))
+        self._pw_rows.append(row)
+        self._pw_cols.append(col)
+        self._pw_dirs.append(_DIR_CODES[direction])
+        self._pw_numbers.append(0)
+        self._pw_clues.append(clue)
+        self._numbers_dirty = True
+        return self._placed_word(k)
+
+    def find_intersections(self, word_bytes: bytes) -> Iterator[tuple]:
+        """Yield each (row, col, direction) where a word (uppercase ASCII bytes) crosses the grid."""
+        word_bytes = _encode_word(word_bytes)
+        g, rows, cols = self.grid, self.rows, self.cols
+        letter_index = self._letter_index
+        pw_rows, pw_cols, pw_dirs = self._pw_rows, self._pw_cols, self._pw_dirs
+        # A spot crossing several placed words is reached once per crossing;
+        # remember each verdict so the placement check runs only once per spot
+        checked = {}
+
+        for i, letter in enumerate(word_bytes):
+            # Only visit placed letters that match; no per-word character scan
+            for k, j in letter_index.get(letter, ()):
+                # New word runs perpendicular to the placed one
+                new_code = 1 - pw_dirs[k]
+                if new_code == 1:
+                    # New word goes DOWN
+                    new_row = pw_rows[k] - i
+                    new_col = pw_cols[k] + j
+                else:
+                    # New word goes ACROSS
+                    new_row = pw_rows[k] + j
+                    new_col = pw_cols[k] - i
+
+                if new_row < 0 or new_col < 0:
+                    continue
+                key = (new_row, new_col, new_code)
+                ok = checked.get(key)
+                if ok is None:
+                    ok = checked[key] = _PLACE_CHECKS[new_code](g, rows, cols, word_bytes,
+                                                                new_row, new_col)
+                if ok:
+                    yield new_row, new_col, _DIRECTIONS[new_code]
 
     def assign_numbers(self):
-        """Assign clue numbers to placed words."""
-        # Find all starting positions
-        starts = {}
-        for pw in self.placed_words:
-            key = (pw.row, pw.col)
-            if key not in starts:
-                starts[key] = []
-            starts[key].append(pw)
-
-        # Sort by position (top to bottom, left to right)
-        sorted_starts = sorted(starts.keys(), key=lambda x: (x[0], x[1]))
-
-        # Assign numbers
-        number = 1
-        for pos in sorted_starts:
-            for pw in starts[pos]:
-                pw.number = number
-            number += 1
+        """Assign clue numbers to placed words.
+
+        Cheap to call repeatedly: numbers are only recomputed after a word
+        has been placed since the last call.
+        """
+        if not self._numbers_dirty:
+            return
+
+        # Sort word indices by start position (top to bottom, left to right)
+        starts = list(zip(self._pw_rows, self._pw_cols))
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+
+        # Sweep: words sharing a start square share a number
+        number = 0
+        last_start = None
+        for k in order:
+            if starts[k] != last_start:
+                number += 1
+                last_start = starts[k]
+            self._pw_numbers[k] = number
+
+        # Words sharing a start square share a number, so duplicates agree
+        self._number_map = dict(zip(starts, self._pw_numbers))
+        # The sweep order is already clue-number order for each direction
+        dirs = self._pw_dirs
+        self._clue_order = ([k for k in order if dirs[k] == 0],
+                            [k for k in order if dirs[k] == 1])
+        self._numbers_dirty = False
 
     def to_ascii(self, show_answers: bool = False) -> str:
         """Convert grid to ASCII representation."""
-        self.assign_numbers()
-
-        # Create number map for display
-        number_map = {}
-        for pw in self.placed_words:
-            key = (pw.row, pw.col)
-            if key not in number_map:
-                number_map[key] = pw.number
+        # Number map pre-formatted as 2-char labels for display
+        number_map = {key: f'{number:>2}' for key, number in self.number_map.items()}
 
         lines = []
+        stride = self._stride
         for r in range(self.rows):
-            row_chars = []
-            for c in range(self.cols):
-                cell = self.grid[r][c]
-                if cell is None or cell == '.':
-                    row_chars.append('███')
-                elif show_answers:
-                    num = number_map.get((r, c), '')
-                    if num:
-                        row_chars.append(f'{num:>2}{cell}')
-                    else:
-                        row_chars.append(f'  {cell}')
-                else:
-                    num = number_map.get((r, c), '')
-                    if num:
-                        row_chars.append(f'{num:>2} ')
-                    else:
-                        row_chars.append('   ')
+            row = self.grid[r * stride:(r + 1) * stride]
+            row_chars = [
+                _BLOCK_CELL if cell <= BLOCK
+                else number_map.get((r, c), _NO_NUMBER) + (chr(cell) if show_answers else ' ')
+                for c, cell in enumerate(row)
+            ]
             lines.append('│'.join(row_chars))
 
         separator = '┼'.join(['───'] * self.cols)
@@ -198,48 +349,37 @@ class CrosswordGrid:
         """Export grid as JSON-compatible dictionary."""
         self.assign_numbers()
 
-        # Convert grid to strings
-        json_grid = []
-        for row in self.grid:
-            json_row = []
-            for cell in row:
-                json_row.append('.' if cell is None else cell)
-            json_grid.append(json_row)
-
-        across = []
-        down = []
-
-        for pw in self.placed_words:
-            entry = {
-                "number": pw.number,
-                "clue": pw.clue,
-                "answer": pw.word,
-                "row": pw.row,
-                "col": pw.col,
-                "length": len(pw.word)
+        # Convert grid to strings, one row slice at a time
+        stride = self._stride
+        json_grid = [
+            list(self.grid[r * stride:(r + 1) * stride].translate(_JSON_CELLS).decode('ascii'))
+            for r in range(self.rows)
+        ]
+
+        def entry(k):
+            word = self._pw_words[k]
+            return {
+                "number": self._pw_numbers[k],
+                "clue": self._pw_clues[k],
+                "answer": word,
+                "row": self._pw_rows[k],
+                "col": self._pw_cols[k],
+                "length": len(word)
             }
-            if pw.direction == Direction.ACROSS:
-                across.append(entry)
-            else:
-                down.append(entry)
 
+        across, down = self._clue_order
         return {
             "size": {"rows": self.rows, "cols": self.cols},
             "grid": json_grid,
             "clues": {
-                "across": sorted(across, key=lambda x: x["number"]),
-                "down": sorted(down, key=lambda x: x["number"])
+                "across": [entry(k) for k in across],
+                "down": [entry(k) for k in down]
             }
         }
 
     def get_clues_formatted(self) -> str:
         """Get formatted clue list."""
-        self.assign_numbers()
-
-        across = sorted([pw for pw in self.placed_words if pw.direction == Direction.ACROSS],
-                       key=lambda x: x.number)
-        down = sorted([pw for pw in self.placed_words if pw.direction == Direction.DOWN],
-                     key=lambda x: x.number)
+        across, down = self.clues_by_direction()
 
         lines = ["**ACROSS**"]
         for pw in across:
@@ -268,19 +408,29 @@ def generate_crossword(words: list, clues: Optional[dict] = None,
 
     Returns:
         CrosswordGrid if successful, None if unable to place all words
+
+    Raises:
+        ValueError: If a word contains non-ASCII characters (the grid stores
+            one ASCII byte per cell) or the longest word exceeds grid_size
     """
     if not words:
         return None
 
+    for word in words:
+        if not word.isascii():
+            raise ValueError(f"Crossword words must be ASCII, got {word!r}")
+
     clues = clues or {}
 
     # Sort words by length (longer first for better placement)
     sorted_words = sorted(words, key=len, reverse=True)
+    if len(sorted_words[0]) > grid_size:
+        raise ValueError(f"{sorted_words[0]!r} is longer than the grid size {grid_size}")
 
     grid = CrosswordGrid(rows=grid_size, cols=grid_size)
 
     # Place the first (longest) word in the center
-    first_word = sorted_words[0].upper()
+    first_word = sorted_words[0].upper().encode('ascii')
     center_row = grid_size // 2
     center_col = (grid_size - len(first_word)) // 2
     grid.place_word(first_word, center_row, center_col, Direction.ACROSS,
@@ -289,24 +439,32 @@ def generate_crossword(words: list, clues: Optional[dict] = None,
     # Try to place remaining words
     placed_count = 1
     for word in sorted_words[1:]:
-        word_upper = word.upper()
-        positions = grid.find_intersections(word_upper)
-
-        if positions:
-            # Shuffle to add variety
-            random.shuffle(positions)
-            row, col, direction = positions[0]
-            grid.place_word(word_upper, row, col, direction, clues.get(word, ""))
+        # Encode once; every placement check below reuses the same bytes
+        word_bytes = word.upper().encode('ascii')
+        # Reservoir-sample one valid intersection (k-th kept with p = 1/k)
+        # for variety without collecting them all
+        chosen = None
+        seen = 0
+        for position in grid.find_intersections(word_bytes):
+            seen += 1
+            if random.random() * seen < 1.0:
+                chosen = position
+
+        if chosen is not None:
+            row, col, direction = chosen
+            grid.place_word(word_bytes, row, col, direction, clues.get(word, ""))
             placed_count += 1
         else:
-            # Try random placement if no intersection found
+            # Try random placement if no intersection found. One draw per
+            # attempt picks the direction and the cell together.
+            randrange = random.randrange
+            cells = grid_size * grid_size
             for _ in range(max_attempts):
-                row = random.randint(0, grid_size - 1)
-                col = random.randint(0, grid_size - 1)
-                direction = random.choice([Direction.ACROSS, Direction.DOWN])
+                code, cell = divmod(randrange(2 * cells), cells)
+                row, col = divmod(cell, grid_size)
 
-                if grid.can_place_word(word_upper, row, col, direction):
-                    grid.place_word(word_upper, row, col, direction, clues.get(word, ""))
+                if _PLACE_CHECKS[code](grid.grid, grid_size, grid_size, word_bytes, row, col):
+                    grid.place_word(word_bytes, row, col, _DIRECTIONS[code], clues.get(word, ""))
                     placed_count += 1
                     break
 
@@ -321,13 +479,17 @@ def _trim_grid(grid: CrosswordGrid) -> CrosswordGrid:
     min_row, max_row = grid.rows, 0
     min_col, max_col = grid.cols, 0
 
+    # Scan one row at a time; strip() finds the letter span at C speed
+    cols = grid.cols
     for r in range(grid.rows):
-        for c in range(grid.cols):
-            if grid.grid[r][c] is not None and grid.grid[r][c] != '.':
-                min_row = min(min_row, r)
-                max_row = max(max_row, r)
-                min_col = min(min_col, c)
-                max_col = max(max_col, c)
+        row = grid.grid[r * cols:(r + 1) * cols]
+        leading = row.lstrip(_NON_LETTERS)
+        if not leading:
+            continue
+        min_row = min(min_row, r)
+        max_row = max(max_row, r)
+        min_col = min(min_col, cols - len(leading))
+        max_col = max(max_col, len(row.rstrip(_NON_LETTERS)) - 1)
 
     if min_row > max_row:
         return grid
@@ -341,17 +503,24 @@ def _trim_grid(grid: CrosswordGrid) -> CrosswordGrid:
     new_rows = max_row - min_row + 1
     new_cols = max_col - min_col + 1
 
-    new_grid = CrosswordGrid(rows=new_rows, cols=new_cols)
+    if new_rows == grid.rows and new_cols == grid.cols:
+        return grid
 
-    for r in range(new_rows):
-        for c in range(new_cols):
-            new_grid.grid[r][c] = grid.grid[r + min_row][c + min_col]
+    # Copy whole row spans into a single new buffer
+    cells = b''.join(
+        grid.grid[r * cols + min_col:r * cols + max_col + 1]
+        for r in range(min_row, max_row + 1)
+    )
+    new_grid = CrosswordGrid(rows=new_rows, cols=new_cols, grid=bytearray(cells))
 
     # Update placed word positions
-    for pw in grid.placed_words:
-        pw.row -= min_row
-        pw.col -= min_col
-        new_grid.placed_words.append(pw)
+    new_grid._pw_words = grid._pw_words
+    new_grid._pw_rows = array('i', [r - min_row for r in grid._pw_rows])
+    new_grid._pw_cols = array('i', [c - min_col for c in grid._pw_cols])
+    new_grid._pw_dirs = grid._pw_dirs
+    new_grid._pw_numbers = grid._pw_numbers
+    new_grid._pw_clues = grid._pw_clues
+    new_grid._letter_index = grid._letter_index
 
     return new_grid
 
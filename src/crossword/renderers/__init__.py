@@ -7,8 +7,9 @@ imported lazily so users only need the libraries for the formats they use.
 
 from __future__ import annotations
 
+import functools
 import os
-from typing import Optional
+from typing import Callable, Optional
 
 from ._base import RenderConfig
 
@@ -17,6 +18,24 @@ __all__ = ["render", "render_all", "RenderConfig"]
 _FORMATS = ("png", "pdf", "html")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_renderer(fmt: str) -> Callable:
+    """Import and return the render function for *fmt* (once per format)."""
+    if fmt == "png":
+        from .png_renderer import render_png
+
+        return render_png
+    if fmt == "pdf":
+        from .pdf_renderer import render_pdf
+
+        return render_pdf
+    if fmt == "html":
+        from .html_renderer import render_html
+
+        return render_html
+    raise ValueError(f"Unknown format {fmt!r}; choose from {_FORMATS}")
+
+
 def render(
     puzzle,
     fmt: str,
@@ -62,18 +81,11 @@ def render(
 
     os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
 
+    renderer = _get_renderer(fmt)
     if fmt == "png":
-        from .png_renderer import render_png
-
-        render_png(puzzle, output_path, config=config, show_answers=show_answers)
-    elif fmt == "pdf":
-        from .pdf_renderer import render_pdf
-
-        render_pdf(puzzle, output_path, config=config)
-    elif fmt == "html":
-        from .html_renderer import render_html
-
-        render_html(puzzle, output_path, config=config)
+        renderer(puzzle, output_path, config=config, show_answers=show_answers)
+    else:
+        renderer(puzzle, output_path, config=config)
 
     return os.path.abspath(output_path)
 
@@ -105,23 +117,16 @@ def render_all(
     def _path(suffix: str) -> str:
         return os.path.join(output_dir, f"{basename}{suffix}")
 
-    from .png_renderer import render_png
-
-    png_path = _path(".png")
-    render_png(puzzle, png_path, config=config, show_answers=False)
+    from .png_renderer import render_png_pair
 
-    png_key_path = _path("_key.png")
-    render_png(puzzle, png_key_path, config=config, show_answers=True)
-
-    from .pdf_renderer import render_pdf
+    # Student and key PNGs share one base render
+    png_path, png_key_path = render_png_pair(puzzle, output_dir, basename=basename, config=config)
 
     pdf_path = _path(".pdf")
-    render_pdf(puzzle, pdf_path, config=config)
-
-    from .html_renderer import render_html
+    _get_renderer("pdf")(puzzle, pdf_path, config=config)
 
     html_path = _path(".html")
-    render_html(puzzle, html_path, config=config)
+    _get_renderer("html")(puzzle, html_path, config=config)
 
     return {
         "png": os.path.abspath(png_path),
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import json
 import os
+import re
+from html import escape as _escape
 from typing import Optional
 
 from ._base import RenderConfig
 from ..grid_generator import CrosswordGrid
 
 
+# Placeholders in _HTML_TEMPLATE look like {{NAME}}
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
 _HTML_TEMPLATE = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -86,57 +91,31 @@ var DATA = {{PUZZLE_JSON}};
 var STORAGE_KEY = "cw_" + location.pathname;
 var grid = DATA.grid, size = DATA.size, clues = DATA.clues;
 var rows = size.rows, cols = size.cols;
-var cells = {};        // "r,c" -> input element
-var cellTds = {};      // "r,c" -> td element
+// Per-cell arrays are indexed by k = r*cols + c
+var cells = new Array(rows*cols);   // k -> input element (undefined for blocks)
+var cellTds = new Array(rows*cols); // k -> td element
+var answers = new Array(rows*cols); // k -> answer letter
+var state = new Array(rows*cols);   // k -> entered letter, mirrors the inputs for saving
+var openCells = [];                 // k of every letter cell, in grid order
 var currentCell = null; // {r, c}
 var currentDir = "across";
 var currentClue = null; // clue object
+var currentClueDir = null; // direction of currentClue, which may differ from currentDir
+var clueLis = {};      // "dir#number" -> clue list item
 
-// Build number map
-var numMap = {};
-function buildNumMap(){
-  clues.across.concat(clues.down).forEach(function(cl){
-    var key = cl.row+","+cl.col;
-    if(!(key in numMap)) numMap[key] = cl.number;
-  });
-}
-buildNumMap();
-
-// Build answer map from clues
-var answerMap = {}; // "r,c" -> letter
-function buildAnswerMap(){
-  clues.across.forEach(function(cl){
-    for(var i=0;i<cl.length;i++){
-      answerMap[cl.row+","+(cl.col+i)] = cl.answer[i];
-    }
-  });
-  clues.down.forEach(function(cl){
-    for(var i=0;i<cl.length;i++){
-      answerMap[(cl.row+i)+","+cl.col] = cl.answer[i];
-    }
-  });
+// Lookup tables precomputed at render time
+var numAt = DATA.numAt;       // k -> clue number, 0 for none
+var acrossAt = DATA.acrossAt; // k -> index into clues.across, -1 for none
+var downAt = DATA.downAt;     // k -> index into clues.down, -1 for none
+
+function clueAt(k, dir){
+  var idx = (dir==="across" ? acrossAt : downAt)[k];
+  return idx < 0 ? null : clues[dir][idx];
 }
-buildAnswerMap();
-
-// Build cell-to-clues mapping
-var cellClues = {}; // "r,c" -> {across: clue|null, down: clue|null}
-function buildCellClues(){
-  clues.across.forEach(function(cl){
-    for(var i=0;i<cl.length;i++){
-      var k = cl.row+","+(cl.col+i);
-      if(!cellClues[k]) cellClues[k]={across:null,down:null};
-      cellClues[k].across = cl;
-    }
-  });
-  clues.down.forEach(function(cl){
-    for(var i=0;i<cl.length;i++){
-      var k = (cl.row+i)+","+cl.col;
-      if(!cellClues[k]) cellClues[k]={across:null,down:null};
-      cellClues[k].down = cl;
-    }
-  });
+
+function cellKey(r, c){
+  return (r<0 || r>=rows || c<0 || c>=cols) ? -1 : r*cols + c;
 }
-buildCellClues();
 
 // Render grid
 var table = document.getElementById("grid");
@@ -145,12 +124,12 @@ for(var r=0;r<rows;r++){
   for(var c=0;c<cols;c++){
     var td = document.createElement("td");
     var val = grid[r][c];
-    var key = r+","+c;
+    var key = r*cols + c;
     if(val === "."){
       td.className = "block";
     } else {
-      var num = numMap[key];
-      if(num !== undefined){
+      var num = numAt[key];
+      if(num){
         var sp = document.createElement("span");
         sp.className = "num";
         sp.textContent = num;
@@ -163,9 +142,14 @@ for(var r=0;r<rows;r++){
       inp.setAttribute("autocomplete","off");
       inp.setAttribute("autocorrect","off");
       inp.setAttribute("spellcheck","false");
+      inp._r = r; // numeric copies of data-r/data-c for the event handlers
+      inp._c = c;
       td.appendChild(inp);
       cells[key] = inp;
       cellTds[key] = td;
+      answers[key] = val;
+      state[key] = "";
+      openCells.push(key);
     }
     tr.appendChild(td);
   }
@@ -181,9 +165,10 @@ function renderClues(direction, containerId){
     li.setAttribute("data-dir", direction);
     li.setAttribute("data-num", cl.number);
     li.textContent = cl.number + ". " + cl.clue + " (" + cl.length + ")";
+    clueLis[direction+"#"+cl.number] = li;
     li.addEventListener("click", function(){
       selectClue(cl, direction);
-      var inp = cells[cl.row+","+cl.col];
+      var inp = cells[cl.row*cols + cl.col];
       if(inp) inp.focus();
     });
     list.appendChild(li);
@@ -192,123 +177,144 @@ function renderClues(direction, containerId){
 renderClues("across","clues-across");
 renderClues("down","clues-down");
 
-// Highlighting
+// Highlighting: only the cells/items marked last time need un-marking
+var highlightedTds = []; // tds carrying "highlight" or "active"
+var checkedTds = [];     // tds carrying "correct" or "incorrect"
+var activeLi = null;
+
+function markTd(td, cls){
+  td.classList.add(cls);
+  highlightedTds.push(td);
+}
+
+function clearChecks(){
+  checkedTds.forEach(function(td){ td.classList.remove("correct","incorrect"); });
+  checkedTds = [];
+}
+
 function clearHighlights(){
-  Object.keys(cellTds).forEach(function(k){
-    cellTds[k].classList.remove("highlight","active","correct","incorrect");
-  });
-  document.querySelectorAll(".clue-list li").forEach(function(li){
-    li.classList.remove("active");
-  });
+  highlightedTds.forEach(function(td){ td.classList.remove("highlight","active"); });
+  highlightedTds = [];
+  clearChecks();
+  if(activeLi){
+    activeLi.classList.remove("active");
+    activeLi = null;
+  }
 }
 
 function highlightClue(cl, dir){
   if(!cl) return;
-  for(var i=0;i<cl.length;i++){
-    var k = dir==="across" ? cl.row+","+(cl.col+i) : (cl.row+i)+","+cl.col;
-    if(cellTds[k]) cellTds[k].classList.add("highlight");
+  var dr = dir==="across" ? 0 : 1, dc = 1 - dr;
+  for(var i=0; i<cl.length; i++){
+    var k = cellKey(cl.row + i*dr, cl.col + i*dc);
+    if(cellTds[k]) markTd(cellTds[k], "highlight");
   }
   // Highlight clue in list
-  var sel = '.clue-list li[data-dir="'+dir+'"][data-num="'+cl.number+'"]';
-  var li = document.querySelector(sel);
-  if(li) li.classList.add("active");
+  var li = clueLis[dir+"#"+cl.number];
+  if(li){
+    li.classList.add("active");
+    activeLi = li;
+  }
 }
 
-function selectClue(cl, dir){
+// Selection state changes immediately; the class changes for it are applied
+// together once per animation frame, however many selections happen first
+var paintPending = false;
+function schedulePaint(){
+  if(paintPending) return;
+  paintPending = true;
+  requestAnimationFrame(function(){
+    paintPending = false;
+    paintSelection();
+  });
+}
+
+function paintSelection(){
   clearHighlights();
-  currentClue = cl;
-  currentDir = dir;
-  highlightClue(cl, dir);
+  highlightClue(currentClue, currentClueDir);
   if(currentCell){
-    var k = currentCell.r+","+currentCell.c;
-    if(cellTds[k]) cellTds[k].classList.add("active");
+    var k = currentCell.r*cols + currentCell.c;
+    if(cellTds[k]) markTd(cellTds[k], "active");
   }
 }
 
+function selectClue(cl, dir){
+  currentClue = cl;
+  currentClueDir = currentDir = dir;
+  schedulePaint();
+}
+
 function selectCell(r, c){
-  var k = r+","+c;
+  var k = cellKey(r, c);
   if(!cells[k]) return;
-  var cc = cellClues[k];
-  if(!cc) return;
+  var hasAcross = acrossAt[k] >= 0, hasDown = downAt[k] >= 0;
+  if(!hasAcross && !hasDown) return;
   // Toggle direction if clicking same cell
   if(currentCell && currentCell.r===r && currentCell.c===c){
-    if(currentDir==="across" && cc.down) currentDir="down";
-    else if(currentDir==="down" && cc.across) currentDir="across";
+    if(currentDir==="across" && hasDown) currentDir="down";
+    else if(currentDir==="down" && hasAcross) currentDir="across";
   } else {
     // Pick direction: prefer current, fallback to what's available
-    if(currentDir==="across" && !cc.across && cc.down) currentDir="down";
-    if(currentDir==="down" && !cc.down && cc.across) currentDir="across";
+    if(currentDir==="across" && !hasAcross && hasDown) currentDir="down";
+    if(currentDir==="down" && !hasDown && hasAcross) currentDir="across";
   }
   currentCell = {r:r, c:c};
-  currentClue = cc[currentDir];
-  clearHighlights();
-  highlightClue(currentClue, currentDir);
-  cellTds[k].classList.add("active");
+  currentClue = clueAt(k, currentDir);
+  currentClueDir = currentDir;
+  schedulePaint();
 }
 
 // Input handling
 table.addEventListener("click", function(e){
-  var inp = e.target.closest("input");
-  if(!inp) return;
-  var r = parseInt(inp.getAttribute("data-r"));
-  var c = parseInt(inp.getAttribute("data-c"));
-  selectCell(r, c);
+  var inp = e.target;
+  if(inp.tagName !== "INPUT") return;
+  selectCell(inp._r, inp._c);
 });
 
 table.addEventListener("input", function(e){
   var inp = e.target;
   if(inp.tagName !== "INPUT") return;
   var val = inp.value.replace(/[^a-zA-Z]/g,"").toUpperCase();
-  inp.value = val ? val[val.length-1] : "";
+  setCell(inp._r*cols + inp._c, val ? val[val.length-1] : "");
   if(val) moveNext();
-  saveProgress();
+  scheduleSave();
 });
 
+// Arrow keys: [row delta, col delta, direction]
+var KEY_MOVES = {
+  ArrowRight: [0, 1, "across"],
+  ArrowLeft: [0, -1, "across"],
+  ArrowDown: [1, 0, "down"],
+  ArrowUp: [-1, 0, "down"]
+};
+
 table.addEventListener("keydown", function(e){
   if(!currentCell) return;
   var r = currentCell.r, c = currentCell.c;
-  switch(e.key){
-    case "ArrowRight":
-      e.preventDefault();
-      currentDir = "across";
-      moveTo(r, c+1);
-      break;
-    case "ArrowLeft":
-      e.preventDefault();
-      currentDir = "across";
-      moveTo(r, c-1);
-      break;
-    case "ArrowDown":
-      e.preventDefault();
-      currentDir = "down";
-      moveTo(r+1, c);
-      break;
-    case "ArrowUp":
-      e.preventDefault();
-      currentDir = "down";
-      moveTo(r-1, c);
-      break;
-    case "Backspace":
-      e.preventDefault();
-      var k = r+","+c;
-      if(cells[k] && cells[k].value){
-        cells[k].value = "";
-      } else {
-        movePrev();
-        var pk = currentCell.r+","+currentCell.c;
-        if(cells[pk]) cells[pk].value = "";
-      }
-      saveProgress();
-      break;
-    case "Tab":
-      e.preventDefault();
-      moveNextClue(e.shiftKey);
-      break;
+  var m = KEY_MOVES[e.key];
+  if(m){
+    e.preventDefault();
+    currentDir = m[2];
+    moveTo(r+m[0], c+m[1]);
+  } else if(e.key === "Backspace"){
+    e.preventDefault();
+    var k = r*cols + c;
+    if(cells[k] && cells[k].value){
+      setCell(k, "");
+    } else {
+      movePrev();
+      var pk = currentCell.r*cols + currentCell.c;
+      if(cells[pk]) setCell(pk, "");
+    }
+    scheduleSave();
+  } else if(e.key === "Tab"){
+    e.preventDefault();
+    moveNextClue(e.shiftKey);
   }
 });
 
 function moveTo(r, c){
-  var k = r+","+c;
+  var k = cellKey(r, c);
   if(cells[k]){
     cells[k].focus();
     selectCell(r, c);
@@ -329,74 +335,97 @@ function movePrev(){
   else moveTo(r-1, c);
 }
 
+// Tab order over all clues, built once; DIR_IDX maps "dir#number" -> position
+var DIRS = clues.across.map(function(cl){ return {cl:cl,dir:"across"}; })
+  .concat(clues.down.map(function(cl){ return {cl:cl,dir:"down"}; }));
+var DIR_IDX = {};
+DIRS.forEach(function(d, i){ DIR_IDX[d.dir+"#"+d.cl.number] = i; });
+
 function moveNextClue(backward){
-  var all = clues.across.concat(clues.down);
   if(!currentClue){
-    selectClue(all[0], "across");
+    selectClue(DIRS[0].cl, DIRS[0].dir);
     return;
   }
-  var dirs = [];
-  clues.across.forEach(function(cl){ dirs.push({cl:cl,dir:"across"}); });
-  clues.down.forEach(function(cl){ dirs.push({cl:cl,dir:"down"}); });
-  var idx = dirs.findIndex(function(d){ return d.cl.number===currentClue.number && d.dir===currentDir; });
-  if(backward) idx = (idx - 1 + dirs.length) % dirs.length;
-  else idx = (idx + 1) % dirs.length;
-  selectClue(dirs[idx].cl, dirs[idx].dir);
-  var inp = cells[dirs[idx].cl.row+","+dirs[idx].cl.col];
+  var idx = DIR_IDX[currentClueDir+"#"+currentClue.number];
+  if(idx === undefined) idx = -1;
+  if(backward) idx = (idx - 1 + DIRS.length) % DIRS.length;
+  else idx = (idx + 1) % DIRS.length;
+  selectClue(DIRS[idx].cl, DIRS[idx].dir);
+  var inp = cells[DIRS[idx].cl.row*cols + DIRS[idx].cl.col];
   if(inp) inp.focus();
 }
 
 // Buttons
 document.getElementById("btn-check").addEventListener("click", function(){
-  Object.keys(cells).forEach(function(k){
+  clearChecks();
+  openCells.forEach(function(k){
     var inp = cells[k];
-    var td = cellTds[k];
-    td.classList.remove("correct","incorrect");
     if(inp.value){
-      if(inp.value.toUpperCase() === answerMap[k]){
-        td.classList.add("correct");
-      } else {
-        td.classList.add("incorrect");
-      }
+      var td = cellTds[k];
+      td.classList.add(inp.value.toUpperCase() === answers[k] ? "correct" : "incorrect");
+      checkedTds.push(td);
     }
   });
-  setTimeout(function(){
-    Object.keys(cellTds).forEach(function(k){
-      cellTds[k].classList.remove("correct","incorrect");
-    });
-  }, 2000);
+  setTimeout(clearChecks, 2000);
 });
 
 document.getElementById("btn-reveal").addEventListener("click", function(){
   if(!currentClue) return;
-  for(var i=0;i<currentClue.length;i++){
-    var k = currentDir==="across"
-      ? currentClue.row+","+(currentClue.col+i)
-      : (currentClue.row+i)+","+currentClue.col;
-    if(cells[k]) cells[k].value = answerMap[k] || "";
+  var dr = currentClueDir==="across" ? 0 : 1, dc = 1 - dr;
+  for(var i=0; i<currentClue.length; i++){
+    // cellKey gives -1 off the grid, so a run never wraps into the next row
+    var k = cellKey(currentClue.row + i*dr, currentClue.col + i*dc);
+    if(cells[k]) setCell(k, answers[k] || "");
   }
-  saveProgress();
+  scheduleSave();
 });
 
 document.getElementById("btn-clear").addEventListener("click", function(){
-  Object.keys(cells).forEach(function(k){ cells[k].value = ""; });
-  saveProgress();
+  openCells.forEach(function(k){ setCell(k, ""); });
+  scheduleSave();
 });
 
 // localStorage persistence
+function setCell(k, v){
+  cells[k].value = v;
+  state[k] = v;
+}
+
+// Writes are batched: at most one pending save, run when the browser is idle
+var saveHandle = 0;
+function scheduleSave(){
+  if(saveHandle) return;
+  saveHandle = window.requestIdleCallback
+    ? window.requestIdleCallback(flushSave, {timeout: 250})
+    : setTimeout(flushSave, 250);
+}
+
+function flushSave(){
+  saveHandle = 0;
+  saveProgress();
+}
+
+// Saved progress stays keyed by "r,c" so earlier saves keep loading
 function saveProgress(){
-  var state = {};
-  Object.keys(cells).forEach(function(k){ state[k] = cells[k].value; });
-  try{ localStorage.setItem(STORAGE_KEY, JSON.stringify(state)); }catch(e){}
+  var saved = {};
+  openCells.forEach(function(k){ saved[Math.floor(k/cols)+","+(k%cols)] = state[k]; });
+  try{ localStorage.setItem(STORAGE_KEY, JSON.stringify(saved)); }catch(e){}
 }
 
+// Don't lose a pending save when the page goes away
+["pagehide","beforeunload"].forEach(function(type){
+  window.addEventListener(type, function(){ if(saveHandle) flushSave(); });
+});
+
 function loadProgress(){
   try{
     var raw = localStorage.getItem(STORAGE_KEY);
     if(!raw) return;
-    var state = JSON.parse(raw);
-    Object.keys(state).forEach(function(k){
-      if(cells[k]) cells[k].value = state[k];
+    var saved = JSON.parse(raw);
+    Object.keys(saved).forEach(function(rc){
+      var p = rc.split(",");
+      var k = cellKey(+p[0], +p[1]);
+      if(cells[k]) setCell(k, saved[rc]);
     });
   }catch(e){}
 }
@@ -407,6 +436,15 @@ loadProgress();
 </body>
 </html>"""
 
+# Literal template text alternating with placeholder names (odd indices),
+# split once so rendering can stream the pieces straight to the file
+_TEMPLATE_PARTS = tuple(_PLACEHOLDER_RE.split(_HTML_TEMPLATE))
+
+
+def _dumps(obj) -> str:
+    """Serialise *obj* as compact JSON for embedding in the page."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 
 def render_html(
     puzzle: CrosswordGrid,
@@ -434,24 +472,51 @@ def render_html(
         config = RenderConfig()
 
     puzzle_data = puzzle.to_json()
+    puzzle_data.update(_build_lookup_tables(puzzle_data))
     title = config.title or "Crossword Puzzle"
 
     subtitle_html = ""
     if config.subtitle:
         subtitle_html = f'<p class="subtitle">{_escape(config.subtitle)}</p>'
 
-    html = _HTML_TEMPLATE
-    html = html.replace("{{TITLE}}", _escape(title))
-    html = html.replace("{{SUBTITLE_HTML}}", subtitle_html)
-    html = html.replace("{{PUZZLE_JSON}}", json.dumps(puzzle_data))
+    # Substituted text is written as-is and never rescanned for placeholders
+    subs = {
+        "TITLE": _escape(title),
+        "SUBTITLE_HTML": subtitle_html,
+        "PUZZLE_JSON": _dumps(puzzle_data),
+    }
+    parts = _TEMPLATE_PARTS
 
     os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html)
+        for i in range(0, len(parts) - 1, 2):
+            f.write(parts[i])
+            f.write(subs[parts[i + 1]])
+        f.write(parts[-1])
 
     return os.path.abspath(output_path)
 
 
-def _escape(s: str) -> str:
-    """Minimal HTML-entity escaping."""
-    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+def _build_lookup_tables(puzzle_data: dict) -> dict:
+    """Precompute the cell lookup tables the page script needs.
+
+    Each table is a flat list indexed by ``r * cols + c``.  ``numAt`` holds
+    the clue number starting in each cell (0 for none); ``acrossAt`` and
+    ``downAt`` hold indices into ``clues["across"]`` / ``clues["down"]``
+    (-1 for none).  Answers are read from ``grid`` by the script itself.
+    """
+    cols = puzzle_data["size"]["cols"]
+    n_cells = puzzle_data["size"]["rows"] * cols
+    num_at = [0] * n_cells
+    tables = {"numAt": num_at}
+
+    for direction, step in (("across", 1), ("down", cols)):
+        clue_at = tables[direction + "At"] = [-1] * n_cells
+        for idx, cl in enumerate(puzzle_data["clues"][direction]):
+            start = cl["row"] * cols + cl["col"]
+            if not num_at[start]:
+                num_at[start] = cl["number"]
+            for k in range(start, start + cl["length"] * step, step):
+                clue_at[k] = idx
+
+    return tables
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import os
-import tempfile
 from typing import Optional
 
 from fpdf import FPDF
+from PIL import Image
 
 from ._base import RenderConfig
-from ..grid_generator import CrosswordGrid, Direction
-from .png_renderer import render_png
+from ..grid_generator import CrosswordGrid
+from .png_renderer import render_png_image, render_png_images
 
 
 def render_pdf(
@@ -47,13 +47,21 @@ def render_pdf(
 
     puzzle.assign_numbers()
 
+    # Both grid images up front; the key reuses the student render's base
+    img_config = _image_config(config)
+    if include_key:
+        student_img, key_img = render_png_images(puzzle, config=img_config)
+    else:
+        student_img = render_png_image(puzzle, config=img_config)
+
     pdf = FPDF()
+    pdf.set_compression(True)
     pdf.set_auto_page_break(auto=True, margin=20)
 
     # --- Page 1: Student worksheet ---
     pdf.add_page()
     _add_header(pdf, config)
-    _add_grid_image(pdf, puzzle, config, show_answers=False)
+    _add_grid_image(pdf, student_img)
     _add_clues(pdf, puzzle)
 
     # --- Page 2: Answer key ---
@@ -62,7 +70,7 @@ def render_pdf(
         pdf.set_font("Helvetica", "B", 16)
         pdf.cell(0, 10, "Answer Key", new_x="LMARGIN", new_y="NEXT", align="C")
         pdf.ln(4)
-        _add_grid_image(pdf, puzzle, config, show_answers=True)
+        _add_grid_image(pdf, key_img)
 
     os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
     pdf.output(output_path)
@@ -99,54 +107,34 @@ def _add_header(pdf: FPDF, config: RenderConfig) -> None:
     pdf.ln(2)
 
 
-def _add_grid_image(
-    pdf: FPDF,
-    puzzle: CrosswordGrid,
-    config: RenderConfig,
-    show_answers: bool,
-) -> None:
-    """Render the grid to a temp PNG and embed it in the PDF."""
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-        tmp_path = tmp.name
-
-    try:
-        # Use a print-friendly config for the embedded image
-        img_config = RenderConfig(
-            cell_size=config.cell_size,
-            dpi=config.dpi,
-            font_family=config.font_family,
-            bg_color=config.bg_color,
-            block_color=config.block_color,
-            line_color=config.line_color,
-            text_color=config.text_color,
-            number_color=config.number_color,
-            cell_font_size=config.cell_font_size,
-            number_font_size=config.number_font_size,
-        )
-        render_png(puzzle, tmp_path, config=img_config, show_answers=show_answers)
-
-        # Calculate image width to fit page (with margins)
-        page_w = pdf.w - pdf.l_margin - pdf.r_margin
-        # Let fpdf scale; cap at page width
-        pdf.image(tmp_path, x=pdf.l_margin, w=min(page_w, 160))
-        pdf.ln(4)
-    finally:
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+def _image_config(config: RenderConfig) -> RenderConfig:
+    """Return a print-friendly config for the embedded grid images."""
+    return RenderConfig(
+        cell_size=config.cell_size,
+        dpi=config.dpi,
+        font_family=config.font_family,
+        bg_color=config.bg_color,
+        block_color=config.block_color,
+        line_color=config.line_color,
+        text_color=config.text_color,
+        number_color=config.number_color,
+        cell_font_size=config.cell_font_size,
+        number_font_size=config.number_font_size,
+    )
+
+
+def _add_grid_image(pdf: FPDF, img: Image.Image) -> None:
+    """Embed a rendered grid image in the PDF."""
+    # Calculate image width to fit page (with margins)
+    page_w = pdf.w - pdf.l_margin - pdf.r_margin
+    # Let fpdf scale; cap at page width
+    pdf.image(img, x=pdf.l_margin, w=min(page_w, 160))
+    pdf.ln(4)
 
 
 def _add_clues(pdf: FPDF, puzzle: CrosswordGrid) -> None:
     """Render the two-column clue list (Across | Down)."""
-    across = sorted(
-        [pw for pw in puzzle.placed_words if pw.direction == Direction.ACROSS],
-        key=lambda pw: pw.number,
-    )
-    down = sorted(
-        [pw for pw in puzzle.placed_words if pw.direction == Direction.DOWN],
-        key=lambda pw: pw.number,
-    )
+    across, down = puzzle.clues_by_direction()
 
     page_w = pdf.w - pdf.l_margin - pdf.r_margin
     col_w = page_w / 2 - 4  # small gap between columns
@@ -2,17 +2,46 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from typing import Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
 from ._base import RenderConfig
-from ..grid_generator import CrosswordGrid, Direction
+from ..grid_generator import BLOCK, CrosswordGrid, Direction
+
+# translate() table turning grid cells into an "L" mask: 255 for EMPTY/BLOCK
+_BLOCK_MASK = bytes(255 if value <= BLOCK else 0 for value in range(256))
 
 
 def _load_font(names: list[str], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     """Try to load a TrueType font by name, falling back to Pillow default."""
+    return _load_font_cached(tuple(names), size)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font_cached(names: tuple[str, ...], size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load (and memoise) the font for *names* at *size*."""
+    source = _resolve_font(names)
+    if source is not None:
+        try:
+            return ImageFont.truetype(source, size)
+        except (OSError, IOError):
+            pass
+    # Fallback
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_font(names: tuple[str, ...]) -> Optional[str]:
+    """Return the first loadable font path (or bare name) for *names*, or None.
+
+    Resolved once per name list so repeat renders skip the directory walk.
+    """
     for name in names:
         # Try common system paths
         for ext in (".ttf", ".otf"):
@@ -20,22 +49,21 @@ def _load_font(names: list[str], size: int) -> ImageFont.FreeTypeFont | ImageFon
                 path = os.path.join(directory, name + ext)
                 if os.path.isfile(path):
                     try:
-                        return ImageFont.truetype(path, size)
+                        ImageFont.truetype(path)
+                        return path
                     except (OSError, IOError):
                         continue
         # Try loading by name directly (works on some systems)
         try:
-            return ImageFont.truetype(name, size)
+            ImageFont.truetype(name)
+            return name
         except (OSError, IOError):
             continue
-    # Fallback
-    try:
-        return ImageFont.load_default(size=size)
-    except TypeError:
-        return ImageFont.load_default()
+    return None
 
 
-def _font_dirs() -> list[str]:
+@functools.lru_cache(maxsize=None)
+def _font_dirs() -> tuple[str, ...]:
     """Return platform-appropriate font directories."""
     import sys
     dirs = []
@@ -55,7 +83,7 @@ def _font_dirs() -> list[str]:
             "/usr/share/fonts",
             "/usr/local/share/fonts",
         ]
-    return dirs
+    return tuple(dirs)
 
 
 def render_png(
@@ -86,8 +114,73 @@ def render_png(
     if config is None:
         config = RenderConfig()
 
-    puzzle.assign_numbers()
+    img = render_png_image(puzzle, config=config, show_answers=show_answers)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
+    _to_palette(img).save(output_path, dpi=(config.dpi, config.dpi))
+    return os.path.abspath(output_path)
+
+
+def _to_palette(img: Image.Image) -> Image.Image:
+    """Return *img* as a palette image when that is lossless, else unchanged.
+
+    A grid uses a handful of colours plus their anti-aliasing blends, which
+    normally fits in 256 entries and makes a much smaller PNG than RGB.
+    """
+    colors = img.getcolors(256)
+    if colors is None:
+        return img
+    # With no more distinct colours than palette slots, median cut gives
+    # every colour its own entry, so the conversion is exact
+    return img.convert("P", palette=Image.ADAPTIVE, colors=len(colors))
+
+
+def render_png_image(
+    puzzle: CrosswordGrid,
+    *,
+    config: Optional[RenderConfig] = None,
+    show_answers: bool = False,
+) -> Image.Image:
+    """Render the crossword grid to an in-memory PIL image.
+
+    Same drawing as :func:`render_png` without touching the filesystem, so
+    callers such as the PDF renderer can embed the image directly.
+    """
+    if config is None:
+        config = RenderConfig()
+
+    img, origin = _render_base(puzzle, config)
+    if show_answers:
+        _draw_letters(img, puzzle, config, origin)
+    return img
+
+
+def render_png_images(
+    puzzle: CrosswordGrid,
+    *,
+    config: Optional[RenderConfig] = None,
+) -> tuple[Image.Image, Image.Image]:
+    """Render the student (blank) and answer-key images in memory.
+
+    The shared base is drawn once and copied for the key.
+
+    Returns (student_image, key_image).
+    """
+    if config is None:
+        config = RenderConfig()
+
+    student, origin = _render_base(puzzle, config)
+    key = student.copy()
+    _draw_letters(key, puzzle, config, origin)
+    return student, key
+
+
+def _render_base(puzzle: CrosswordGrid, config: RenderConfig) -> tuple[Image.Image, tuple[int, int]]:
+    """Draw everything except the answer letters.
 
+    Returns the image together with the pixel origin of the grid, which
+    :func:`_draw_letters` needs to overlay the answers.
+    """
     cs = config.cell_size
     rows, cols = puzzle.rows, puzzle.cols
     grid_w = cols * cs
@@ -107,7 +200,6 @@ def render_png(
     # Fonts
     title_font = _load_font(config.font_family, config.title_font_size)
     subtitle_font = _load_font(config.font_family, config.title_font_size - 6)
-    cell_font = _load_font(config.font_family, config.cell_font_size)
     num_font = _load_font(config.font_family, config.number_font_size)
 
     # Draw title
@@ -126,47 +218,60 @@ def render_png(
     gx = cs  # left padding
     gy = title_h + cs  # top padding + title area
 
-    # Build number map
-    number_map: dict[tuple[int, int], int] = {}
-    for pw in puzzle.placed_words:
-        key = (pw.row, pw.col)
-        if key not in number_map:
-            number_map[key] = pw.number
-
-    # Draw cells
-    for r in range(rows):
-        for c in range(cols):
-            x = gx + c * cs
-            y = gy + r * cs
-            cell = puzzle.grid[r][c]
-
-            if cell is None or cell == ".":
-                # Blocked cell
-                draw.rectangle([x, y, x + cs, y + cs], fill=config.block_color)
-            else:
-                # Letter cell
-                draw.rectangle([x, y, x + cs, y + cs], fill=config.bg_color, outline=config.line_color, width=1)
-
-                # Number
-                num = number_map.get((r, c))
-                if num is not None:
-                    draw.text((x + 2, y + 1), str(num), fill=config.number_color, font=num_font)
-
-                # Letter
-                if show_answers:
-                    bbox = draw.textbbox((0, 0), cell, font=cell_font)
-                    lw = bbox[2] - bbox[0]
-                    lh = bbox[3] - bbox[1]
-                    lx = x + (cs - lw) / 2
-                    ly = y + (cs - lh) / 2 + 2  # slight offset for number space
-                    draw.text((lx, ly), cell, fill=config.text_color, font=cell_font)
+    # Grid lines: one line per row/column boundary instead of one outline per cell
+    for c in range(cols + 1):
+        x = gx + c * cs
+        draw.line([x, gy, x, gy + grid_h], fill=config.line_color, width=1)
+    for r in range(rows + 1):
+        y = gy + r * cs
+        draw.line([gx, y, gx + grid_w, y], fill=config.line_color, width=1)
+
+    # Blocked cells: upscale a one-pixel-per-cell mask and fill it in one paste
+    block_mask = Image.frombytes("L", (cols, rows), bytes(puzzle.grid).translate(_BLOCK_MASK))
+    block_mask = block_mask.resize((grid_w, grid_h), Image.NEAREST)
+    img.paste(config.block_color, (gx, gy, gx + grid_w, gy + grid_h), block_mask)
+
+    # Only numbers and letters still need per-cell glyph drawing
+    for (r, c), num in puzzle.number_map.items():
+        draw.text((gx + c * cs + 2, gy + r * cs + 1), str(num), fill=config.number_color, font=num_font)
 
     # Outer grid border
     draw.rectangle([gx, gy, gx + grid_w, gy + grid_h], outline=config.line_color, width=2)
 
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)) or ".", exist_ok=True)
-    img.save(output_path, dpi=(config.dpi, config.dpi))
-    return os.path.abspath(output_path)
+    return img, (gx, gy)
+
+
+def _draw_letters(
+    img: Image.Image,
+    puzzle: CrosswordGrid,
+    config: RenderConfig,
+    origin: tuple[int, int],
+) -> None:
+    """Overlay the answer letters onto a base image in place."""
+    draw = ImageDraw.Draw(img)
+    cell_font = _load_font(config.font_family, config.cell_font_size)
+    cs = config.cell_size
+    cols = puzzle.cols
+    gx, gy = origin
+
+    # Measure each distinct letter once: (glyph, x offset, y offset) in a cell
+    metrics: dict[int, tuple[str, float, float]] = {}
+    for code in set(puzzle.grid):
+        if code <= BLOCK:
+            continue
+        letter = chr(code)
+        bbox = draw.textbbox((0, 0), letter, font=cell_font)
+        lw = bbox[2] - bbox[0]
+        lh = bbox[3] - bbox[1]
+        # slight y offset for number space
+        metrics[code] = (letter, (cs - lw) / 2, (cs - lh) / 2 + 2)
+
+    for i, cell in enumerate(puzzle.grid):
+        if cell <= BLOCK:
+            continue
+        r, c = divmod(i, cols)
+        letter, dx, dy = metrics[cell]
+        draw.text((gx + c * cs + dx, gy + r * cs + dy), letter, fill=config.text_color, font=cell_font)
 
 
 def render_png_pair(
@@ -188,7 +293,10 @@ def render_png_pair(
     student = os.path.join(output_dir, f"{basename}.png")
     key = os.path.join(output_dir, f"{basename}_key.png")
 
-    render_png(puzzle, student, config=config, show_answers=False)
-    render_png(puzzle, key, config=config, show_answers=True)
+    student_img, key_img = render_png_images(puzzle, config=config)
+
+    dpi = (config.dpi, config.dpi)
+    _to_palette(student_img).save(student, dpi=dpi)
+    _to_palette(key_img).save(key, dpi=dpi)
 
     return os.path.abspath(student), os.path.abspath(key)
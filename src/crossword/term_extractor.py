@@ -5,13 +5,14 @@ This module provides functions to extract meaningful terms from source text
 that are suitable for crossword puzzles.
 """
 
+import functools
 import re
 from collections import Counter
 from dataclasses import dataclass
 
 
-# Common English words to exclude (stop words)
-STOP_WORDS = {
+# Common English words to exclude (stop words), all lowercase
+STOP_WORDS = frozenset({
     'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i',
     'it', 'for', 'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at',
     'this', 'but', 'his', 'by', 'from', 'they', 'we', 'say', 'her', 'she',
@@ -27,17 +28,52 @@ STOP_WORDS = {
     'very', 'more', 'much', 'many', 'each', 'every', 'both', 'few', 'own',
     'same', 'through', 'during', 'before', 'between', 'under', 'again',
     'further', 'once', 'why', 'while', 'should', 'must', 'might', 'may'
-}
+})
+
+# Patterns used on every call, compiled once. Keep single-character choices
+# as character classes ([.!?], not (\.|!|\?)): a class is one cheap test,
+# an alternation backtracks through each branch.
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_WORD_RE = re.compile(r'\b[A-Za-z]+\b')
+_DEF_RE = re.compile(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+_CLASS_RE = re.compile(r'class\s+([A-Z][a-zA-Z0-9]*)')
+_CAMEL_WORD_RE = re.compile(r'[A-Z][a-z]+')
+_DOCSTRING_DQ_RE = re.compile(r'"""(.*?)"""', re.DOTALL)
+_DOCSTRING_SQ_RE = re.compile(r"'''(.*?)'''", re.DOTALL)
+_COMMENT_RE = re.compile(r'#\s*(.+)$', re.MULTILINE)
+
+# translate() table for tokenising ASCII text without the regex engine:
+# everything except word characters ([A-Za-z0-9_], what \b looks at)
+# becomes a space
+_ASCII_NON_WORD = str.maketrans({
+    c: ' ' for c in map(chr, range(128)) if not (c.isalnum() or c == '_')
+})
 
 
 @dataclass
 class ExtractedTerm:
     """Represents a term extracted from source text."""
+    # No per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('term', 'frequency', 'context')
+
     term: str
     frequency: int
     context: str  # Sentence where term appears
 
 
+def _lower_words(sentence: str) -> list:
+    """Return the words _WORD_RE finds in *sentence*, lowercased."""
+    if sentence.isascii():
+        # Splitting on non-word characters yields whole \w runs, and
+        # \b[A-Za-z]+\b matches exactly the runs made only of letters
+        return [
+            word for word in sentence.lower().translate(_ASCII_NON_WORD).split()
+            if word.isalpha()
+        ]
+    # Non-ASCII letters count as word characters for \b, so defer to the regex
+    return [word.lower() for word in _WORD_RE.findall(sentence)]
+
+
 def extract_terms_from_text(
     text: str,
     min_length: int = 4,
@@ -58,54 +94,41 @@ def extract_terms_from_text(
     Returns:
         List of ExtractedTerm objects sorted by relevance
     """
-    # Split into sentences for context
-    sentences = re.split(r'[.!?]+', text)
-    sentence_map = {}  # word -> first sentence containing it
+    # The analysis is memoised; each call still gets its own ExtractedTerm
+    # objects, so callers are free to modify what they receive
+    return [
+        ExtractedTerm(term=term, frequency=frequency, context=context)
+        for term, frequency, context in _extract_terms(text, min_length, max_length, max_terms)
+    ]
 
-    # Extract all words
-    words = re.findall(r'\b[A-Za-z]+\b', text)
 
-    # Count frequencies
+@functools.lru_cache(maxsize=32)
+def _extract_terms(text: str, min_length: int, max_length: int, max_terms: int) -> tuple:
+    """Return the top (term, frequency, context) tuples for *text*."""
     word_counts = Counter()
-
-    for sentence in sentences:
-        sentence_words = re.findall(r'\b[A-Za-z]+\b', sentence)
-        for word in sentence_words:
-            word_lower = word.lower()
-            word_counts[word_lower] += 1
-
-            # Store first sentence as context
-            if word_lower not in sentence_map:
-                sentence_map[word_lower] = sentence.strip()
-
-    # Filter words
-    filtered_terms = []
-
-    for word, count in word_counts.items():
-        # Check length constraints
-        if len(word) < min_length or len(word) > max_length:
-            continue
-
-        # Skip stop words
-        if word.lower() in STOP_WORDS:
-            continue
-
-        # Check if word only contains letters
-        if not word.isalpha():
+    sentence_map = {}  # word -> first sentence containing it, truncated
+
+    # Filter while counting so junk words never enter the tables
+    # (the word pattern only matches letters, so isalpha() is implied)
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        kept = [
+            word for word in _lower_words(sentence)
+            if min_length <= len(word) <= max_length and word not in STOP_WORDS
+        ]
+        if not kept:
             continue
+        word_counts.update(kept)
 
-        context = sentence_map.get(word, "")
-        filtered_terms.append(ExtractedTerm(
-            term=word.upper(),
-            frequency=count,
-            context=context[:200]  # Truncate context
-        ))
-
-    # Sort by frequency (higher = more important)
-    filtered_terms.sort(key=lambda x: x.frequency, reverse=True)
+        context = sentence.strip()[:200]
+        for word in kept:
+            sentence_map.setdefault(word, context)
 
-    # Return top terms
-    return filtered_terms[:max_terms]
+    # Top terms by frequency (higher = more important); ties keep
+    # first-appearance order
+    return tuple(
+        (word.upper(), count, sentence_map[word])
+        for word, count in word_counts.most_common(max_terms)
+    )
 
 
 def extract_terms_from_code(code: str, language: str = "python") -> list:
@@ -129,7 +152,7 @@ def extract_terms_from_code(code: str, language: str = "python") -> list:
 
     if language.lower() == "python":
         # Extract function names
-        functions = re.findall(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', code)
+        functions = _DEF_RE.findall(code)
         for func in functions:
             # Convert snake_case to words
             words = func.split('_')
@@ -142,10 +165,10 @@ def extract_terms_from_code(code: str, language: str = "python") -> list:
                     ))
 
         # Extract class names
-        classes = re.findall(r'class\s+([A-Z][a-zA-Z0-9]*)', code)
+        classes = _CLASS_RE.findall(code)
         for cls in classes:
             # Split CamelCase
-            words = re.findall(r'[A-Z][a-z]+', cls)
+            words = _CAMEL_WORD_RE.findall(cls)
             for word in words:
                 if len(word) >= 4:
                     terms.append(ExtractedTerm(
@@ -154,28 +177,27 @@ def extract_terms_from_code(code: str, language: str = "python") -> list:
                         context=f"Class: {cls}"
                     ))
 
-        # Extract from docstrings
-        docstrings = re.findall(r'"""(.*?)"""', code, re.DOTALL)
-        docstrings += re.findall(r"'''(.*?)'''", code, re.DOTALL)
-        for doc in docstrings:
-            doc_terms = extract_terms_from_text(doc)
-            terms.extend(doc_terms)
-
-        # Extract from comments
-        comments = re.findall(r'#\s*(.+)$', code, re.MULTILINE)
-        for comment in comments:
-            comment_terms = extract_terms_from_text(comment)
-            terms.extend(comment_terms)
-
-    # Deduplicate by term
-    seen = set()
-    unique_terms = []
+        # Extract from docstrings, then comments. Each distinct block is
+        # processed once: a repeat yields the same terms, all of which the
+        # first copy already contributed.
+        blocks = _DOCSTRING_DQ_RE.findall(code)
+        blocks += _DOCSTRING_SQ_RE.findall(code)
+        blocks += _COMMENT_RE.findall(code)
+        for block in dict.fromkeys(blocks):
+            terms.extend(extract_terms_from_text(block))
+
+    # Deduplicate by term, keeping the first occurrence (dicts keep insertion order)
+    unique_terms = {}
     for term in terms:
-        if term.term not in seen:
-            seen.add(term.term)
-            unique_terms.append(term)
+        unique_terms.setdefault(term.term, term)
 
-    return unique_terms
+    return list(unique_terms.values())
+
+
+@functools.lru_cache(maxsize=512)
+def _blank_pattern(term: str) -> re.Pattern:
+    """Return the compiled whole-word, case-insensitive pattern for *term*."""
+    return re.compile(rf'\b{re.escape(term)}\b', re.IGNORECASE)
 
 
 def suggest_clue(term: str, context: str) -> str:
@@ -194,20 +216,18 @@ def suggest_clue(term: str, context: str) -> str:
     """
     # Simple template-based clue generation
     # Claude will generate better clues, but this provides a fallback
+    fallback = f"[Define: {term}]"
+
+    # A plain substring test rules out most contexts before the regex runs
+    if not context or term.lower() not in context.lower():
+        return fallback
+
+    # Create fill-in-the-blank style clue
+    blank_context = _blank_pattern(term).sub('_____', context)
+    if len(blank_context) < 100:
+        return blank_context
 
-    if context:
-        # Create fill-in-the-blank style clue
-        if term.lower() in context.lower():
-            blank_context = re.sub(
-                rf'\b{re.escape(term)}\b',
-                '_____',
-                context,
-                flags=re.IGNORECASE
-            )
-            if len(blank_context) < 100:
-                return blank_context
-
-    return f"[Define: {term}]"
+    return fallback
 
 
 if __name__ == "__main__":
@@ -3,11 +3,15 @@
 import pytest
 
 from src.crossword.grid_generator import CrosswordGrid, Direction, generate_crossword
+from src.crossword.renderers._base import RenderConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_puzzle():
-    """A small deterministic puzzle for testing renderers."""
+    """A small deterministic puzzle for testing renderers.
+
+    Shared by the whole session; tests that modify it must work on a copy.
+    """
     words = ["PYTHON", "LOOP", "CLASS", "METHOD", "OBJECT"]
     clues = {
         "PYTHON": "Popular programming language",
@@ -21,9 +25,12 @@ def sample_puzzle():
     return puzzle
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_puzzle():
-    """A very small hand-built puzzle (2 words intersecting)."""
+    """A very small hand-built puzzle (2 words intersecting).
+
+    Shared by the whole session; tests that modify it must work on a copy.
+    """
     grid = CrosswordGrid(rows=5, cols=5)
     grid.place_word("CAT", 1, 1, Direction.ACROSS, clue="Feline pet")
     grid.place_word("CUP", 1, 1, Direction.DOWN, clue="Drinking vessel")
@@ -31,6 +38,34 @@ def minimal_puzzle():
     return grid
 
 
+# Rendered once per session for tests that only inspect the output; tests
+# exercising a specific config or entry point still render their own copy
+@pytest.fixture(scope="session")
+def rendered_sample_html(sample_puzzle, tmp_path_factory):
+    """Path of sample_puzzle rendered to HTML with a title and subtitle."""
+    from src.crossword.renderers.html_renderer import render_html
+
+    cfg = RenderConfig(title="Vocabulary Review", subtitle="PSYC 405")
+    return render_html(sample_puzzle, str(tmp_path_factory.mktemp("renders") / "sample.html"), config=cfg)
+
+
+@pytest.fixture(scope="session")
+def rendered_sample_pdf(sample_puzzle, tmp_path_factory):
+    """Path of sample_puzzle rendered to PDF with a title and subtitle."""
+    from src.crossword.renderers.pdf_renderer import render_pdf
+
+    cfg = RenderConfig(title="Vocabulary Review", subtitle="PSYC 405")
+    return render_pdf(sample_puzzle, str(tmp_path_factory.mktemp("renders") / "sample.pdf"), config=cfg)
+
+
+@pytest.fixture(scope="session")
+def rendered_sample_png(sample_puzzle, tmp_path_factory):
+    """Path of sample_puzzle rendered to an answer-key PNG."""
+    from src.crossword.renderers.png_renderer import render_png
+
+    return render_png(sample_puzzle, str(tmp_path_factory.mktemp("renders") / "sample.png"), show_answers=True)
+
+
 @pytest.fixture
 def tmp_output(tmp_path):
     """Return a temporary directory path for output files."""
@@ -0,0 +1,174 @@
+"""Tests for the crossword grid generator."""
+
+import copy
+
+import pytest
+
+from src.crossword.grid_generator import (
+    BLOCK,
+    EMPTY,
+    CrosswordGrid,
+    Direction,
+    generate_crossword,
+)
+
+
+class TestGridStorage:
+    def test_new_grid_is_flat_and_empty(self):
+        grid = CrosswordGrid(rows=3, cols=4)
+        assert isinstance(grid.grid, bytearray)
+        assert len(grid.grid) == 12
+        assert all(cell == EMPTY for cell in grid.grid)
+
+    def test_place_word_writes_row_major(self):
+        grid = CrosswordGrid(rows=5, cols=5)
+        grid.place_word("cat", 1, 1, Direction.ACROSS)
+        grid.place_word("cup", 1, 1, Direction.DOWN)
+        assert grid.grid[1 * 5 + 1:1 * 5 + 4] == b"CAT"
+        assert bytes(grid.grid[1 * 5 + 1::5][:3]) == b"CUP"
+
+    @pytest.mark.parametrize("row, col, direction", [
+        (4, 4, Direction.ACROSS),
+        (4, 4, Direction.DOWN),
+        (0, -1, Direction.ACROSS),
+        (5, 0, Direction.ACROSS),
+    ])
+    def test_place_word_out_of_bounds(self, row, col, direction):
+        grid = CrosswordGrid(rows=5, cols=5)
+        with pytest.raises(ValueError, match="does not fit"):
+            grid.place_word("ABC", row, col, direction)
+        assert grid.grid == bytearray(25)
+        assert grid.placed_words == ()
+
+    def test_to_json_decodes_cells(self, minimal_puzzle):
+        data = minimal_puzzle.to_json()
+        assert data["grid"][1][1:4] == ["C", "A", "T"]
+        assert data["grid"][0][0] == "."
+
+
+class TestPlacedWords:
+    def test_clue_writes_through(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        for pw in puzzle.placed_words:
+            pw.clue = f"New clue for {pw.word}"
+        assert [pw.clue for pw in puzzle.placed_words] == ["New clue for CAT", "New clue for CUP"]
+        assert "1. New clue for CAT (3 letters)" in puzzle.get_clues_formatted()
+
+    def test_placed_words_is_immutable(self, minimal_puzzle):
+        assert isinstance(minimal_puzzle.placed_words, tuple)
+
+    def test_constructor_places_words(self, minimal_puzzle):
+        grid = CrosswordGrid(rows=5, cols=5, placed_words=minimal_puzzle.placed_words)
+        assert grid == minimal_puzzle
+        assert grid.grid == minimal_puzzle.grid
+
+    def test_equality_compares_words_and_clues(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        assert puzzle == minimal_puzzle
+        puzzle.placed_words[0].clue = "Something else"
+        assert puzzle.grid == minimal_puzzle.grid
+        assert puzzle != minimal_puzzle
+        assert "Something else" in repr(puzzle)
+
+    def test_layout_fields_read_only(self, minimal_puzzle):
+        pw = minimal_puzzle.placed_words[0]
+        with pytest.raises(AttributeError):
+            pw.row = 2
+        assert minimal_puzzle.placed_words[0].row == 1
+
+
+class TestCanPlaceWord:
+    def test_out_of_bounds(self):
+        grid = CrosswordGrid(rows=5, cols=5)
+        assert not grid.can_place_word("TOOLONG", 0, 0, Direction.ACROSS)
+        assert not grid.can_place_word("TOOLONG", 0, 0, Direction.DOWN)
+
+    def test_matching_intersection(self, minimal_puzzle):
+        assert minimal_puzzle.can_place_word("TOP", 1, 3, Direction.DOWN)
+
+    def test_conflicting_letter(self, minimal_puzzle):
+        assert not minimal_puzzle.can_place_word("DOG", 1, 3, Direction.DOWN)
+
+    def test_blocked_cell(self):
+        grid = CrosswordGrid(rows=3, cols=3)
+        grid.grid[1 * 3 + 1] = BLOCK
+        assert not grid.can_place_word("ABC", 1, 0, Direction.ACROSS)
+        assert grid.can_place_word("ABC", 0, 0, Direction.ACROSS)
+
+    def test_adjacent_letter_at_end(self, minimal_puzzle):
+        # A word ending right before "CAT" would run into it
+        assert not minimal_puzzle.can_place_word("X", 1, 0, Direction.ACROSS)
+
+
+class TestFindIntersections:
+    def test_finds_crossing_position(self, minimal_puzzle):
+        assert list(minimal_puzzle.find_intersections("TOP")) == [(1, 3, Direction.DOWN)]
+
+    def test_no_shared_letters(self, minimal_puzzle):
+        assert list(minimal_puzzle.find_intersections("XYZ")) == []
+
+    def test_accepts_encoded_words(self, minimal_puzzle):
+        assert list(minimal_puzzle.find_intersections(b"TOP")) == [(1, 3, Direction.DOWN)]
+
+    def test_refreshed_after_placement(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        assert list(puzzle.find_intersections("TOP")) == [(1, 3, Direction.DOWN)]
+        puzzle.place_word("TAB", 1, 3, Direction.DOWN)
+        assert list(puzzle.find_intersections("TOP")) == []
+
+
+class TestAssignNumbers:
+    def test_shared_start_shares_number(self, minimal_puzzle):
+        assert [pw.number for pw in minimal_puzzle.placed_words] == [1, 1]
+
+    def test_renumbers_after_placement(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        puzzle.assign_numbers()
+        puzzle.place_word("TOP", 1, 3, Direction.DOWN)
+        puzzle.assign_numbers()
+        assert [pw.number for pw in puzzle.placed_words] == [1, 1, 2]
+
+    def test_number_map_tracks_placements(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        assert puzzle.number_map == {(1, 1): 1}
+        puzzle.place_word("TOP", 1, 3, Direction.DOWN)
+        assert puzzle.number_map == {(1, 1): 1, (1, 3): 2}
+
+    def test_clues_by_direction_sorted(self, minimal_puzzle):
+        puzzle = copy.deepcopy(minimal_puzzle)
+        puzzle.place_word("TOP", 1, 3, Direction.DOWN)
+        across, down = puzzle.clues_by_direction()
+        assert [pw.word for pw in across] == ["CAT"]
+        assert [(pw.number, pw.word) for pw in down] == [(1, "CUP"), (2, "TOP")]
+
+
+class TestGenerateCrossword:
+    def test_empty_word_list(self):
+        assert generate_crossword([]) is None
+
+    def test_rejects_non_ascii_word(self):
+        with pytest.raises(ValueError, match="CAFÉ"):
+            generate_crossword(["CAFÉ", "CAT"])
+
+    def test_rejects_word_longer_than_grid(self):
+        with pytest.raises(ValueError, match="ABCDEFGHIJ"):
+            generate_crossword(["ABCDEFGHIJ", "AXE"], grid_size=5)
+
+    def test_places_all_words(self, sample_puzzle):
+        placed = {pw.word for pw in sample_puzzle.placed_words}
+        assert placed == {"PYTHON", "LOOP", "CLASS", "METHOD", "OBJECT"}
+
+    def test_placed_words_match_grid(self, sample_puzzle):
+        cols = sample_puzzle.cols
+        for pw in sample_puzzle.placed_words:
+            for i, letter in enumerate(pw.word):
+                if pw.direction == Direction.ACROSS:
+                    cell = sample_puzzle.grid[pw.row * cols + pw.col + i]
+                else:
+                    cell = sample_puzzle.grid[(pw.row + i) * cols + pw.col]
+                assert chr(cell) == letter
+
+    def test_trimmed_to_content(self, sample_puzzle):
+        assert sample_puzzle.rows <= 15
+        assert sample_puzzle.cols <= 15
+        assert len(sample_puzzle.grid) == sample_puzzle.rows * sample_puzzle.cols
@@ -5,7 +5,7 @@ import os
 import pytest
 
 from src.crossword.renderers._base import RenderConfig
-from src.crossword.renderers.html_renderer import render_html
+from src.crossword.renderers.html_renderer import _build_lookup_tables, render_html
 
 
 class TestRenderHtml:
@@ -86,13 +86,50 @@ class TestRenderHtml:
         assert '<script>alert("xss")</script>' not in html
         assert "&lt;script&gt;" in html
 
-    def test_sample_puzzle(self, sample_puzzle, tmp_output):
-        cfg = RenderConfig(title="Vocabulary Review", subtitle="PSYC 405")
-        path = os.path.join(tmp_output, "sample.html")
-        render_html(sample_puzzle, path, config=cfg)
-        assert os.path.isfile(path)
+    def test_placeholder_text_in_title_not_expanded(self, minimal_puzzle, tmp_output):
+        cfg = RenderConfig(title="Quiz {{PUZZLE_JSON}}")
+        path = os.path.join(tmp_output, "placeholder.html")
+        render_html(minimal_puzzle, path, config=cfg)
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        assert "<h1>Quiz {{PUZZLE_JSON}}</h1>" in html
+
+    def test_sample_puzzle(self, rendered_sample_html):
+        assert os.path.isfile(rendered_sample_html)
+
+    def test_sample_puzzle_content(self, rendered_sample_html, sample_puzzle):
+        with open(rendered_sample_html, "r", encoding="utf-8") as f:
+            html = f.read()
+        assert "<title>Vocabulary Review</title>" in html
+        assert "PSYC 405" in html
+        for pw in sample_puzzle.placed_words:
+            assert f'"answer":"{pw.word}"' in html
 
     def test_creates_parent_dirs(self, minimal_puzzle, tmp_output):
         path = os.path.join(tmp_output, "nested", "dir", "test.html")
         result = render_html(minimal_puzzle, path)
         assert os.path.isfile(result)
+
+
+class TestLookupTables:
+    def test_minimal_puzzle_tables(self, minimal_puzzle):
+        tables = _build_lookup_tables(minimal_puzzle.to_json())
+        cols = minimal_puzzle.cols
+        assert len(tables["numAt"]) == minimal_puzzle.rows * cols
+        assert [k for k, n in enumerate(tables["numAt"]) if n] == [1 * cols + 1]
+        assert tables["numAt"][1 * cols + 1] == 1
+        across = [k for k, i in enumerate(tables["acrossAt"]) if i >= 0]
+        down = [k for k, i in enumerate(tables["downAt"]) if i >= 0]
+        assert across == [1 * cols + 1, 1 * cols + 2, 1 * cols + 3]
+        assert down == [1 * cols + 1, 2 * cols + 1, 3 * cols + 1]
+        assert tables["acrossAt"][1 * cols + 3] == 0
+        assert tables["downAt"][1 * cols + 3] == -1
+
+    def test_tables_embedded(self, minimal_puzzle, tmp_output):
+        path = os.path.join(tmp_output, "test.html")
+        render_html(minimal_puzzle, path)
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        assert '"numAt"' in html
+        assert '"acrossAt"' in html
+        assert "buildCellClues" not in html
@@ -41,11 +41,12 @@ class TestRenderPdf:
         # PDF with key should be larger
         assert os.path.getsize(path_with) > os.path.getsize(path_without)
 
-    def test_sample_puzzle(self, sample_puzzle, tmp_output):
-        cfg = RenderConfig(title="Vocabulary Review", subtitle="PSYC 405")
-        path = os.path.join(tmp_output, "sample.pdf")
-        render_pdf(sample_puzzle, path, config=cfg)
-        assert os.path.isfile(path)
+    def test_sample_puzzle(self, rendered_sample_pdf):
+        assert os.path.isfile(rendered_sample_pdf)
+
+    def test_sample_puzzle_header(self, rendered_sample_pdf):
+        with open(rendered_sample_pdf, "rb") as f:
+            assert f.read(5) == b"%PDF-"
 
     def test_creates_parent_dirs(self, minimal_puzzle, tmp_output):
         path = os.path.join(tmp_output, "nested", "dir", "test.pdf")
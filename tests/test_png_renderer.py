@@ -6,7 +6,12 @@ import pytest
 from PIL import Image
 
 from src.crossword.renderers._base import RenderConfig
-from src.crossword.renderers.png_renderer import render_png, render_png_pair
+from src.crossword.renderers.png_renderer import (
+    render_png,
+    render_png_image,
+    render_png_images,
+    render_png_pair,
+)
 
 
 class TestRenderPng:
@@ -27,6 +32,11 @@ class TestRenderPng:
         assert img.format == "PNG"
         assert img.size[0] > 0 and img.size[1] > 0
 
+    def test_saved_as_palette_image(self, minimal_puzzle, tmp_output):
+        path = os.path.join(tmp_output, "test.png")
+        render_png(minimal_puzzle, path, show_answers=True)
+        assert Image.open(path).mode == "P"
+
     def test_answer_key_differs(self, minimal_puzzle, tmp_output):
         blank = os.path.join(tmp_output, "blank.png")
         key = os.path.join(tmp_output, "key.png")
@@ -48,10 +58,32 @@ class TestRenderPng:
         result = render_png(minimal_puzzle, path)
         assert os.path.isfile(result)
 
-    def test_sample_puzzle(self, sample_puzzle, tmp_output):
-        path = os.path.join(tmp_output, "sample.png")
-        render_png(sample_puzzle, path, show_answers=True)
-        assert os.path.isfile(path)
+    def test_sample_puzzle(self, rendered_sample_png):
+        assert os.path.isfile(rendered_sample_png)
+
+    def test_sample_puzzle_matches_grid(self, rendered_sample_png, sample_puzzle):
+        img = Image.open(rendered_sample_png)
+        assert img.format == "PNG"
+        cs = RenderConfig().cell_size  # one cell of padding per side
+        assert img.size == ((sample_puzzle.cols + 2) * cs, (sample_puzzle.rows + 2) * cs)
+
+
+class TestRenderPngImage:
+    def test_returns_image(self, minimal_puzzle):
+        img = render_png_image(minimal_puzzle)
+        assert isinstance(img, Image.Image)
+        assert img.size[0] > 0 and img.size[1] > 0
+
+    def test_matches_saved_png(self, minimal_puzzle, tmp_output):
+        path = os.path.join(tmp_output, "test.png")
+        render_png(minimal_puzzle, path, show_answers=True)
+        img = render_png_image(minimal_puzzle, show_answers=True)
+        assert Image.open(path).convert("RGB").tobytes() == img.convert("RGB").tobytes()
+
+    def test_image_pair_matches_single_renders(self, minimal_puzzle):
+        student, key = render_png_images(minimal_puzzle)
+        assert student.tobytes() == render_png_image(minimal_puzzle).tobytes()
+        assert key.tobytes() == render_png_image(minimal_puzzle, show_answers=True).tobytes()
 
 
 class TestRenderPngPair:
@@ -68,3 +100,9 @@ class TestRenderPngPair:
         )
         assert "ch5.png" in student
         assert "ch5_key.png" in key
+
+    def test_matches_single_renders(self, minimal_puzzle, tmp_output):
+        student, key = render_png_pair(minimal_puzzle, str(tmp_output))
+        for path, show_answers in ((student, False), (key, True)):
+            img = render_png_image(minimal_puzzle, show_answers=show_answers)
+            assert Image.open(path).convert("RGB").tobytes() == img.convert("RGB").tobytes()
@@ -0,0 +1,124 @@
+"""Tests for the term extractor."""
+
+from src.crossword.term_extractor import (
+    extract_terms_from_code,
+    extract_terms_from_text,
+    suggest_clue,
+)
+
+SAMPLE_TEXT = (
+    "Recursion solves problems by recursion on smaller inputs. "
+    "A stack tracks each call! Recursion needs a base case? "
+    "The stack unwinds."
+)
+
+
+class TestExtractTermsFromText:
+    def test_counts_case_insensitively(self):
+        terms = {t.term: t.frequency for t in extract_terms_from_text(SAMPLE_TEXT)}
+        assert terms["RECURSION"] == 3
+        assert terms["STACK"] == 2
+
+    def test_sorted_by_frequency(self):
+        terms = extract_terms_from_text(SAMPLE_TEXT)
+        assert [t.term for t in terms[:2]] == ["RECURSION", "STACK"]
+        freqs = [t.frequency for t in terms]
+        assert freqs == sorted(freqs, reverse=True)
+
+    def test_ties_keep_first_appearance_order(self):
+        terms = extract_terms_from_text("zebra apple mango")
+        assert [t.term for t in terms] == ["ZEBRA", "APPLE", "MANGO"]
+
+    def test_context_is_first_sentence(self):
+        terms = {t.term: t for t in extract_terms_from_text(SAMPLE_TEXT)}
+        assert terms["STACK"].context == "A stack tracks each call"
+
+    def test_context_truncated(self):
+        text = "keyword " + "filler " * 100
+        (term,) = extract_terms_from_text(text, max_terms=1)
+        assert len(term.context) == 200
+
+    def test_filters_stop_words_and_length(self):
+        terms = {t.term for t in extract_terms_from_text(SAMPLE_TEXT, min_length=5, max_length=6)}
+        assert "STACK" in terms
+        assert "RECURSION" not in terms  # too long
+        assert "BASE" not in terms  # too short
+        assert "EACH" not in terms  # stop word
+
+    def test_max_terms(self):
+        assert len(extract_terms_from_text(SAMPLE_TEXT, max_terms=2)) == 2
+        assert extract_terms_from_text(SAMPLE_TEXT, max_terms=0) == []
+
+    def test_empty_text(self):
+        assert extract_terms_from_text("") == []
+
+    def test_repeat_calls_return_fresh_terms(self):
+        first = extract_terms_from_text(SAMPLE_TEXT)
+        first[0].frequency = 99
+        first.clear()
+        again = extract_terms_from_text(SAMPLE_TEXT)
+        assert again[0].term == "RECURSION"
+        assert again[0].frequency == 3
+
+    def test_only_whole_ascii_words(self):
+        # Letters glued to digits, underscores or non-ASCII letters are not words
+        text = "graph word2vec snake_case naïve graph"
+        assert [t.term for t in extract_terms_from_text(text)] == ["GRAPH"]
+        assert [t.term for t in extract_terms_from_text(text.replace("naïve", "naive"))] == [
+            "GRAPH", "NAIVE",
+        ]
+
+
+class TestExtractTermsFromCode:
+    CODE = (
+        "def compute_average(values):\n"
+        '    """Average every value. Values matter."""\n'
+        "    # iterate values carefully\n"
+        "    return sum(values)\n"
+        "\n"
+        "class NeuralNetwork:\n"
+        "    pass\n"
+    )
+
+    def test_names_split_into_words(self):
+        terms = [t.term for t in extract_terms_from_code(self.CODE)]
+        assert terms[:4] == ["COMPUTE", "AVERAGE", "NEURAL", "NETWORK"]
+
+    def test_deduplicated(self):
+        terms = [t.term for t in extract_terms_from_code(self.CODE)]
+        assert len(terms) == len(set(terms))
+        assert "VALUES" in terms
+        assert "CAREFULLY" in terms
+
+    def test_first_occurrence_wins(self):
+        terms = {t.term: t for t in extract_terms_from_code(self.CODE)}
+        assert terms["AVERAGE"].context == "Function: compute_average"
+
+    def test_repeated_comments(self):
+        code = "# cache lookups here\n" * 3 + "# flush cache\n"
+        terms = extract_terms_from_code(code)
+        assert [(t.term, t.context) for t in terms] == [
+            ("CACHE", "cache lookups here"),
+            ("LOOKUPS", "cache lookups here"),
+            ("FLUSH", "flush cache"),
+        ]
+
+    def test_other_languages_yield_nothing(self):
+        assert extract_terms_from_code(self.CODE, language="javascript") == []
+
+
+class TestSuggestClue:
+    def test_blanks_term_case_insensitively(self):
+        assert suggest_clue("STACK", "A Stack tracks calls") == "A _____ tracks calls"
+
+    def test_whole_words_only(self):
+        assert suggest_clue("CAT", "Concatenate a cat") == "Concatenate a _____"
+
+    def test_fallback_without_context(self):
+        assert suggest_clue("STACK", "") == "[Define: STACK]"
+
+    def test_fallback_when_term_absent(self):
+        assert suggest_clue("STACK", "A queue tracks calls") == "[Define: STACK]"
+
+    def test_fallback_when_context_long(self):
+        assert suggest_clue("STACK", "stack " + "x" * 120) == "[Define: STACK]"